@@ -25,25 +25,38 @@ import os
 import sys
 import shutil
 import json
+import functools
+import math
 import subprocess
+import tempfile
+import threading
 import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Tuple
 import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor, wait as futures_wait
 
-from PySide6.QtCore import Qt, QMimeData, Signal, QObject, QThread
+from PySide6.QtCore import Qt, QMimeData, Signal, QObject, QRunnable, QThreadPool, QTimer
 from PySide6.QtGui import QAction, QIcon
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QFileDialog, QListWidget, QListWidgetItem,
-    QMessageBox, QCheckBox, QProgressBar, QTextEdit, QFrame, QAbstractItemView,
+    QMessageBox, QCheckBox, QProgressBar, QPlainTextEdit, QFrame, QAbstractItemView,
     QSpinBox
 )
 
 APP_TITLE = "MP4 → HLS (No-Reencode)"
 APP_NAME = "bikindesign_mp4_to_hls"
 
+
+def default_parallel_jobs() -> int:
+    # -c copy HLS segmenting is I/O bound, so half the cores is plenty
+    return max(1, (os.cpu_count() or 2) // 2)
+
 def get_config_path() -> Path:
     if sys.platform.startswith("win"):
         base = Path(os.getenv("APPDATA", Path.home()))
@@ -59,6 +72,16 @@ def get_config_path() -> Path:
 CONFIG_FILE = get_config_path()
 
 
+def write_json_atomic(path: Path, data):
+    """Write JSON to a sibling temp file and rename it over ``path``, so readers never see a partial file."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
 # ---------- FFmpeg discovery ----------
 
 def _exe_name(name: str) -> str:
@@ -67,8 +90,39 @@ def _exe_name(name: str) -> str:
     return name
 
 
+def _is_bundled_path(path: str) -> bool:
+    """True for binaries shipped next to the script, incl. a PyInstaller --onefile temp extraction.
+
+    Those locations are per-process, so they must never be remembered in settings.
+    """
+    roots = [Path(__file__).parent, Path(tempfile.gettempdir())]
+    if hasattr(sys, "_MEIPASS"):
+        roots.append(Path(sys._MEIPASS))
+    p = Path(path).resolve()
+    return any(p.is_relative_to(root.resolve()) for root in roots)
+
+
+def load_ffmpeg_paths() -> Optional[Tuple[str, str]]:
+    """Return the ffmpeg/ffprobe paths remembered in settings, if both still exist."""
+    if CONFIG_FILE.exists():
+        try:
+            data = json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
+            ffmpeg_path, ffprobe_path = data["ffmpeg_paths"]
+            if any(_is_bundled_path(c) for c in (ffmpeg_path, ffprobe_path)):
+                return None
+            if Path(ffmpeg_path).exists() and Path(ffprobe_path).exists():
+                return ffmpeg_path, ffprobe_path
+        except Exception:
+            pass
+    return None
+
+
+@functools.lru_cache(maxsize=1)
 def find_ffmpeg_binaries() -> Tuple[str, str]:
-    """Try to find ffmpeg and ffprobe in PATH or local ./bin folder."""
+    """Try to find ffmpeg and ffprobe in PATH or local ./bin folder (memoized).
+
+    Paths remembered in settings are only used when the fresh lookup fails.
+    """
     candidates = [
         shutil.which("ffmpeg"),
         str(Path(__file__).parent / "bin" / _exe_name("ffmpeg"))
@@ -82,6 +136,9 @@ def find_ffmpeg_binaries() -> Tuple[str, str]:
     ffprobe_path = next((c for c in candidates_probe if c and Path(c).exists()), None)
 
     if not ffmpeg_path or not ffprobe_path:
+        saved = load_ffmpeg_paths()
+        if saved:
+            return saved
         raise FileNotFoundError(
             "FFmpeg/FFprobe not found. Please install FFmpeg and ensure both 'ffmpeg' and 'ffprobe' are in PATH,\n"
             "or place them in a './bin' folder next to this script."
@@ -90,7 +147,54 @@ def find_ffmpeg_binaries() -> Tuple[str, str]:
 
 # ---------- Probing utilities ----------
 
-def ffprobe_streams(ffprobe_path: str, input_path: str) -> dict:
+FFPROBE_CACHE_FILE = CONFIG_FILE.parent / "ffprobe_cache.json"
+FFPROBE_CACHE_MAX = 256
+
+
+def _load_ffprobe_cache() -> dict:
+    if FFPROBE_CACHE_FILE.exists():
+        try:
+            data = json.loads(FFPROBE_CACHE_FILE.read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                return {k: v for k, v in data.items() if isinstance(v, dict)}
+        except Exception:
+            pass
+    return {}
+
+
+_ffprobe_cache = _load_ffprobe_cache()
+_ffprobe_cache_dirty = False
+_ffprobe_cache_lock = threading.Lock()
+_ffprobe_flush_lock = threading.Lock()
+
+
+def _trim_probe(meta: dict) -> dict:
+    """Keep only what get_duration_seconds/codecs_are_hls_friendly read, so cache entries stay tiny."""
+    return {
+        "format": {k: v for k, v in meta.get("format", {}).items() if k == "duration"},
+        "streams": [
+            {k: st[k] for k in ("codec_type", "codec_name") if k in st}
+            for st in meta.get("streams", [])
+        ],
+    }
+
+
+def flush_ffprobe_cache():
+    """Persist the probe cache if it changed; the disk write happens outside the cache lock."""
+    global _ffprobe_cache_dirty
+    with _ffprobe_flush_lock:
+        with _ffprobe_cache_lock:
+            if not _ffprobe_cache_dirty:
+                return
+            snapshot = dict(_ffprobe_cache)
+            _ffprobe_cache_dirty = False
+        try:
+            write_json_atomic(FFPROBE_CACHE_FILE, snapshot)
+        except OSError:
+            pass
+
+
+def _ffprobe_streams_raw(ffprobe_path: str, input_path: str) -> str:
     cmd = [
         ffprobe_path,
         "-v", "error",
@@ -102,7 +206,26 @@ def ffprobe_streams(ffprobe_path: str, input_path: str) -> dict:
     proc = subprocess.run(cmd, capture_output=True, text=True)
     if proc.returncode != 0:
         raise RuntimeError(proc.stderr.strip())
-    return json.loads(proc.stdout)
+    return proc.stdout
+
+
+def ffprobe_streams(ffprobe_path: str, input_path: str, size: int, mtime: int) -> dict:
+    """Probe a file, reusing the previous result while its size/mtime are unchanged.
+
+    New results are only kept in memory; call flush_ffprobe_cache() to persist them.
+    """
+    global _ffprobe_cache_dirty
+    key = f"{input_path}|{size}|{mtime}"
+    with _ffprobe_cache_lock:
+        meta = _ffprobe_cache.get(key)
+    if meta is None:
+        meta = _trim_probe(json.loads(_ffprobe_streams_raw(ffprobe_path, input_path)))
+        with _ffprobe_cache_lock:
+            _ffprobe_cache[key] = meta
+            while len(_ffprobe_cache) > FFPROBE_CACHE_MAX:
+                del _ffprobe_cache[next(iter(_ffprobe_cache))]
+            _ffprobe_cache_dirty = True
+    return meta
 
 
 def get_duration_seconds(meta: dict) -> float:
@@ -121,8 +244,245 @@ def codecs_are_hls_friendly(meta: dict) -> bool:
             a_ok = s.get("codec_name") in ("aac", "mp3", "ac3")  # HLS can handle a few
     return v_ok and a_ok
 
+
+def _drain_lines(stream, sink: deque):
+    """Read a stream to EOF line by line, keeping only what fits in ``sink``."""
+    for line in stream:
+        sink.append(line)
+
+
+FFMPEG_NICENESS = 5
+
+
+def _low_priority_popen_kwargs() -> dict:
+    """Popen kwargs that start a child below normal priority (Windows only; see _lower_priority)."""
+    if sys.platform.startswith("win"):
+        return {"creationflags": subprocess.BELOW_NORMAL_PRIORITY_CLASS | subprocess.CREATE_NO_WINDOW}
+    return {}
+
+
+def _lower_priority(proc: subprocess.Popen):
+    # Done from the parent rather than via preexec_fn, which is unsafe with worker threads
+    if hasattr(os, "setpriority"):
+        try:
+            os.setpriority(os.PRIO_PROCESS, proc.pid, FFMPEG_NICENESS)
+        except OSError:
+            pass
+
+
+def _ffmpeg_error(err_tail: deque) -> str:
+    lines = [line.decode("utf-8", "replace").rstrip() for line in err_tail]
+    detail = "\n".join(line for line in lines if line)
+    msg = "ffmpeg failed — check logs and ensure codecs are supported."
+    return f"{msg}\n{detail}" if detail else msg
+
+# ---------- In-process HLS segmenter ----------
+
+TS_PACKET_SIZE = 188
+TS_CLOCK = 90_000
+TS_VIDEO_STREAM_TYPES = (0x1B, 0x24)  # H.264, HEVC
+
+
+class SegmentError(Exception):
+    pass
+
+
+class TsSegmenter:
+    """Split an MPEG-TS byte stream into HLS segments at video keyframes.
+
+    ffmpeg's mpegts muxer flags keyframes with the random_access_indicator, so a
+    new segment is started on the first flagged video PES whose PTS is at least
+    ``segment_seconds`` past the start of the current one. Every segment is
+    prefixed with the latest PAT/PMT so it can be decoded on its own. With
+    ``-c copy`` those cuts are the source's own GOP boundaries, so no separate
+    keyframe probe is needed.
+
+    Packets are streamed into the writer returned by ``open_segment(name)``;
+    only the trailing partial packet of each fed chunk is buffered.
+    """
+
+    def __init__(self, segment_seconds: int, open_segment):
+        self.target = segment_seconds * TS_CLOCK
+        self.open_segment = open_segment
+        self.durations: List[float] = []
+        self._pending = bytearray()
+        self._out = None  # writer for the current segment
+        self._pat = b""
+        self._pmt = b""
+        self._pmt_pid: Optional[int] = None
+        self._video_pid: Optional[int] = None
+        self._first_pts: Optional[int] = None
+        self._seg_start_pts: Optional[int] = None
+        self._last_pts: Optional[int] = None
+
+    @property
+    def position(self) -> float:
+        """Seconds of video muxed so far."""
+        if self._first_pts is None or self._last_pts is None:
+            return 0.0
+        return (self._last_pts - self._first_pts) / TS_CLOCK
+
+    def feed(self, data: bytes):
+        self._pending += data
+        end = len(self._pending) - len(self._pending) % TS_PACKET_SIZE
+        mv = memoryview(self._pending)
+        # Write runs of packets in one call; a run ends only where a new segment starts
+        run_start = 0
+        for off in range(0, end, TS_PACKET_SIZE):
+            cut_pts = self._packet(mv[off:off + TS_PACKET_SIZE])
+            if cut_pts is not None:
+                self._write(mv[run_start:off])
+                self._cut(cut_pts)
+                run_start = off
+        self._write(mv[run_start:end])
+        del mv
+        del self._pending[:end]
+
+    def finish(self):
+        if self._pending:
+            raise SegmentError("truncated TS packet at end of stream")
+        if self._seg_start_pts is None:
+            raise SegmentError("no video keyframe found in stream")
+        self._end_segment(self._last_pts)
+
+    def close(self):
+        """Close the open segment writer, if any (e.g. after an error)."""
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+
+    def playlist(self) -> str:
+        lines = [
+            "#EXTM3U",
+            "#EXT-X-VERSION:3",
+            f"#EXT-X-TARGETDURATION:{math.ceil(max(self.durations, default=0))}",
+            "#EXT-X-MEDIA-SEQUENCE:0",
+        ]
+        for n, dur in enumerate(self.durations):
+            lines += [f"#EXTINF:{dur:.6f},", self.segment_name(n)]
+        lines.append("#EXT-X-ENDLIST")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def segment_name(n: int) -> str:
+        return f"segment_{n:05d}.ts"
+
+    def _write(self, data):
+        if not data:
+            return
+        if self._out is None:
+            self._out = self.open_segment(self.segment_name(len(self.durations)))
+        self._out.write(data)
+
+    def _end_segment(self, end_pts: int):
+        self.durations.append(max(0.0, (end_pts - self._seg_start_pts) / TS_CLOCK))
+        self.close()
+
+    def _cut(self, pts: int):
+        self._end_segment(pts)
+        self._seg_start_pts = pts
+        self._write(self._pat + self._pmt)
+
+    def _packet(self, pkt) -> Optional[int]:
+        """Track PSI/PTS state for one packet; return the PTS to cut at if a new segment starts here."""
+        if pkt[0] != 0x47:
+            raise SegmentError("lost MPEG-TS sync")
+        pid = ((pkt[1] & 0x1F) << 8) | pkt[2]
+        pusi = pkt[1] & 0x40
+        afc = (pkt[3] >> 4) & 0x3
+        offset, rai = 4, False
+        if afc & 0x2:
+            af_len = pkt[4]
+            rai = af_len > 0 and bool(pkt[5] & 0x40)
+            offset = 5 + af_len
+        payload = pkt[offset:] if afc & 0x1 else b""
+
+        cut_pts = None
+        try:
+            if pid == 0:
+                self._pat = bytes(pkt)
+                if pusi and self._pmt_pid is None:
+                    self._pmt_pid = self._parse_pat(payload)
+            elif pid == self._pmt_pid:
+                self._pmt = bytes(pkt)
+                if pusi and self._video_pid is None:
+                    self._video_pid = self._parse_pmt(payload)
+        except IndexError as e:
+            raise SegmentError("malformed PAT/PMT section") from e
+
+        if pid == self._video_pid and pusi:
+            pts = self._parse_pts(payload)
+            if pts is not None:
+                if self._first_pts is None:
+                    self._first_pts = pts
+                if rai:
+                    if self._seg_start_pts is None:
+                        self._seg_start_pts = pts
+                    elif pts - self._seg_start_pts >= self.target:
+                        cut_pts = pts
+                self._last_pts = max(pts, self._last_pts or pts)
+        return cut_pts
+
+    @staticmethod
+    def _section(payload) -> bytes:
+        if not payload:
+            raise SegmentError("empty PSI packet")
+        sec = payload[1 + payload[0]:]
+        if len(sec) < 3:
+            raise SegmentError("truncated PSI section")
+        length = ((sec[1] & 0x0F) << 8) | sec[2]
+        if length < 4 or 3 + length > len(sec):
+            raise SegmentError("PSI section does not fit in one packet")
+        return sec[:3 + length - 4]  # drop CRC32
+
+    def _parse_pat(self, payload: bytes) -> int:
+        sec = self._section(payload)
+        for i in range(8, len(sec) - 3, 4):
+            program = (sec[i] << 8) | sec[i + 1]
+            if program != 0:
+                return ((sec[i + 2] & 0x1F) << 8) | sec[i + 3]
+        raise SegmentError("no program in PAT")
+
+    def _parse_pmt(self, payload: bytes) -> int:
+        sec = self._section(payload)
+        i = 12 + (((sec[10] & 0x0F) << 8) | sec[11])
+        while i + 5 <= len(sec):
+            stream_type = sec[i]
+            es_pid = ((sec[i + 1] & 0x1F) << 8) | sec[i + 2]
+            if stream_type in TS_VIDEO_STREAM_TYPES:
+                return es_pid
+            i += 5 + (((sec[i + 3] & 0x0F) << 8) | sec[i + 4])
+        raise SegmentError("no H.264/HEVC video stream in PMT")
+
+    @staticmethod
+    def _parse_pts(payload: bytes) -> Optional[int]:
+        if len(payload) < 14 or payload[:3] != b"\x00\x00\x01" or not payload[7] & 0x80:
+            return None
+        p = payload[9:14]
+        return (((p[0] >> 1) & 0x07) << 30) | (p[1] << 22) | ((p[2] >> 1) << 15) | (p[3] << 7) | (p[4] >> 1)
+
 # ---------- Conversion worker (thread) ----------
 
+ZIP_BUFFER_SIZE = 1 << 20  # large writes keep the zip step memcpy-bound, not syscall-bound
+
+_trash_pool = ThreadPoolExecutor(max_workers=1)
+
+
+def discard_dir(path: Path, ignore_errors: bool = True):
+    """Rename ``path`` out of the way and delete it in the background.
+
+    If the rename fails (e.g. a file inside is open on Windows) the folder is
+    removed in place; with ``ignore_errors=False`` that failure is raised, so a
+    folder that must be empty before reuse is never left half-deleted.
+    """
+    trash = path.with_name(f"{path.name}.trash-{uuid.uuid4().hex}")
+    try:
+        path.rename(trash)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=ignore_errors)
+        return
+    _trash_pool.submit(shutil.rmtree, trash, ignore_errors=True)
+
 @dataclass
 class Job:
     src: Path
@@ -130,6 +490,25 @@ class Job:
     skip_if_incompatible: bool = True
     enable_transcode_if_needed: bool = False  # Off by default per spec
     segment_seconds: int = 6
+    zip_compress: bool = False  # .ts segments are already compressed; DEFLATE gains ~nothing
+    meta: Optional[dict] = field(default=None, repr=False)  # ffprobe output, filled in before conversion
+    out_stem: Optional[str] = None  # output name without extension; defaults to src.stem
+
+    @property
+    def stem(self) -> str:
+        return self.out_stem or self.src.stem
+
+
+def unique_output_stems(paths: Iterable[Path]) -> Iterator[Tuple[Path, str]]:
+    """Pair each path with an output stem, suffixing repeats as "clip (2)" so parallel jobs never share an output."""
+    taken = set()
+    for p in paths:
+        stem, n = p.stem, 1
+        while stem.casefold() in taken:  # case-insensitive for Windows/macOS filesystems
+            n += 1
+            stem = f"{p.stem} ({n})"
+        taken.add(stem.casefold())
+        yield p, stem
 
 
 class Signals(QObject):
@@ -140,71 +519,239 @@ class Signals(QObject):
     all_done = Signal()
 
 
-class ConverterThread(QThread):
-    def __init__(self, jobs: List[Job]):
+class JobRunnable(QRunnable):
+    """Runs one job of a ConverterBatch on a QThreadPool."""
+
+    def __init__(self, batch: "ConverterBatch", job: Job, probe: Future):
         super().__init__()
-        self.jobs = jobs
-        self.sig = Signals()
-        self._stop = False
+        self.batch = batch
+        self.job = job
+        self.probe = probe
+        self.setAutoDelete(True)
 
     def run(self):
+        self.batch._run_and_report(self.job, self.probe)
+
+
+class ConverterBatch:
+    def __init__(self, jobs: List[Job], parallel_jobs: Optional[int] = None):
+        self.jobs = jobs
+        self.parallel_jobs = max(1, min(len(jobs), parallel_jobs or default_parallel_jobs()))
+        self.sig = Signals()
+        self._stop = threading.Event()
+        self._procs = set()
+        self._procs_lock = threading.Lock()
+        self._ffmpeg_bin = self._ffprobe_bin = ""
+        self._count_lock = threading.Lock()
+        self._finished = 0
+        self._done = 0
+        self._last_pct = -1
+
+    def start(self, pool: QThreadPool):
         try:
-            ffmpeg, ffprobe = find_ffmpeg_binaries()
+            self._ffmpeg_bin, self._ffprobe_bin = find_ffmpeg_binaries()
         except Exception as e:
             self.sig.log.emit(f"ERROR: {e}")
             self.sig.all_done.emit()
             return
 
-        total = len(self.jobs)
-        for i, job in enumerate(self.jobs, start=1):
-            if self._stop:
-                break
-            try:
-                self._process_one(ffmpeg, ffprobe, job)
-                self.sig.file_done.emit(job.src.name, "OK")
-            except SkipError as e:
-                self.sig.log.emit(f"SKIP: {job.src.name} — {e}")
-                self.sig.file_done.emit(job.src.name, "SKIP")
-            except Exception as e:
-                self.sig.log.emit(f"FAIL: {job.src.name} — {e}")
-                self.sig.file_done.emit(job.src.name, "FAIL")
-            self.sig.progress.emit(int(i * 100 / total))
-
-        self.sig.all_done.emit()
+        # Probe the whole batch up front, overlapping the ffprobe spawns
+        probe_pool = ThreadPoolExecutor(max_workers=min(8, len(self.jobs)))
+        probes = [probe_pool.submit(self._probe, self._ffprobe_bin, job) for job in self.jobs]
+        probe_pool.submit(self._persist_probes, probes)  # queued last, so it only waits on running probes
+        probe_pool.shutdown(wait=False)
+
+        pool.setMaxThreadCount(self.parallel_jobs)
+        for job, probe in zip(self.jobs, probes):
+            pool.start(JobRunnable(self, job, probe))
+
+    def _run_and_report(self, job: Job, probe: Future):
+        job.meta = probe.result()
+        status = self._run_job(self._ffmpeg_bin, self._ffprobe_bin, job)
+        with self._count_lock:
+            self._finished += 1
+            if status is not None:  # None: cancelled before it started
+                self._done += 1
+                self.sig.file_done.emit(job.src.name, status)
+                pct = int(self._done * 100 / len(self.jobs))
+                if pct != self._last_pct:
+                    self.sig.progress.emit(pct)
+                    self._last_pct = pct
+            all_finished = self._finished == len(self.jobs)
+        if all_finished:
+            flush_ffprobe_cache()  # picks up any re-probes done by _process_one
+            self.sig.all_done.emit()
 
     def stop(self):
-        self._stop = True
+        self._stop.set()
+        with self._procs_lock:
+            for proc in self._procs:
+                proc.terminate()
+
+    @staticmethod
+    def _probe(ffprobe: str, job: Job) -> Optional[dict]:
+        try:
+            st = job.src.stat()
+            return ffprobe_streams(ffprobe, str(job.src), st.st_size, int(st.st_mtime))
+        except Exception:
+            return None  # _process_one probes again and reports the error
+
+    @staticmethod
+    def _persist_probes(probes: List[Future]):
+        futures_wait(probes)
+        flush_ffprobe_cache()
+
+    def _run_job(self, ffmpeg: str, ffprobe: str, job: Job) -> Optional[str]:
+        if self._stop.is_set():
+            return None
+        try:
+            self._process_one(ffmpeg, ffprobe, job)
+            return "OK"
+        except SkipError as e:
+            self.sig.log.emit(f"SKIP: {job.src.name} — {e}")
+            return "SKIP"
+        except Exception as e:
+            self.sig.log.emit(f"FAIL: {job.src.name} — {e}")
+            return "FAIL"
+
+    @contextmanager
+    def _ffmpeg(self, args: List[str]):
+        """Run ffmpeg with stdout piped (as bytes) to the caller; raise if it fails or is cancelled."""
+        with subprocess.Popen(args, stderr=subprocess.PIPE, stdout=subprocess.PIPE, close_fds=True,
+                              **_low_priority_popen_kwargs()) as proc:
+            _lower_priority(proc)
+            # stderr is only kept for error reporting; drain it so ffmpeg never blocks on a full pipe
+            err_tail = deque(maxlen=200)
+            err_reader = threading.Thread(target=_drain_lines, args=(proc.stderr, err_tail), daemon=True)
+            err_reader.start()
+            with self._procs_lock:
+                self._procs.add(proc)
+                if self._stop.is_set():
+                    proc.terminate()
+            try:
+                yield proc
+            except BaseException:
+                proc.kill()
+                raise
+            finally:
+                rc = proc.wait()
+                err_reader.join()
+                with self._procs_lock:
+                    self._procs.discard(proc)
+            if self._stop.is_set():
+                raise RuntimeError("Dibatalkan.")
+            if rc != 0:
+                raise RuntimeError(_ffmpeg_error(err_tail))
 
     # ---- core per-file processing ----
     def _process_one(self, ffmpeg: str, ffprobe: str, job: Job):
         src = job.src
-        out_dir = job.out_root / (src.stem + "_hls")
-        if out_dir.exists():
-            shutil.rmtree(out_dir)
-        out_dir.mkdir(parents=True, exist_ok=True)
-
-        meta = ffprobe_streams(ffprobe, str(src))
+        meta = job.meta
+        if meta is None:
+            st = src.stat()
+            meta = ffprobe_streams(ffprobe, str(src), st.st_size, int(st.st_mtime))
         duration = max(1.0, get_duration_seconds(meta))
         hls_ok = codecs_are_hls_friendly(meta)
 
         if not hls_ok and job.skip_if_incompatible and not job.enable_transcode_if_needed:
             raise SkipError("Codecs not HLS-friendly (need H.264 video and AAC/MP3/AC3 audio).")
 
+        if hls_ok:
+            codec_args = ["-c:v", "copy", "-c:a", "copy", "-avoid_negative_ts", "make_zero"]
+        else:
+            # Transcode path (if user later enables); split the cores between parallel jobs
+            threads = max(1, (os.cpu_count() or 1) // self.parallel_jobs)
+            codec_args = [
+                "-c:v", "libx264", "-preset", "veryfast", "-crf", "18", "-threads", str(threads),
+                "-c:a", "aac", "-b:a", "192k",
+            ]
+
+        zip_path = job.out_root / f"{job.stem}.zip"
+        if zip_path.exists():
+            zip_path.unlink()
+        try:
+            try:
+                self._stream_to_zip(ffmpeg, job, codec_args, duration, zip_path)
+            except SegmentError as e:
+                self.sig.log.emit(f"WARN: {src.name} — direct segmenting failed ({e}), using a temp folder.")
+                zip_path.unlink(missing_ok=True)
+                self._convert_via_folder(ffmpeg, job, codec_args, duration, zip_path)
+        except BaseException:
+            zip_path.unlink(missing_ok=True)
+            raise
+
+        self.sig.log.emit(f"DONE: {src.name} → {zip_path.name}")
+        self.sig.file_progress.emit(src.name, 100)
+
+    @contextmanager
+    def _zip_file(self, job: Job, zip_path: Path, presize: int = 0):
+        """Open the output zip over a 1 MiB write buffer; yields ``(zipfile, compress_type)``."""
+        if job.zip_compress:
+            compression, compresslevel = zipfile.ZIP_DEFLATED, 6
+        else:
+            compression, compresslevel = zipfile.ZIP_STORED, None
+        with open(zip_path, 'wb', buffering=ZIP_BUFFER_SIZE) as fp:
+            if presize and hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(fp.fileno(), 0, presize)
+                except OSError:
+                    pass
+            with zipfile.ZipFile(fp, 'w', compression=compression, compresslevel=compresslevel,
+                                 allowZip64=True, strict_timestamps=False) as zf:
+                yield zf, compression
+            if presize:
+                fp.truncate()  # drop whatever was preallocated past the central directory
+
+    def _stream_to_zip(self, ffmpeg: str, job: Job, codec_args: List[str], duration: float, zip_path: Path):
+        """Mux to MPEG-TS on stdout and segment in-process, writing straight into the zip."""
+        src = job.src
+        args = [
+            ffmpeg, "-hide_banner", "-loglevel", "error", "-nostats",
+            "-fflags", "+genpts", "-i", str(src),
+            *codec_args,
+            "-f", "mpegts", "pipe:1",
+        ]
+
+        with self._zip_file(job, zip_path) as (zf, compression):
+            def open_segment(name: str):
+                info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+                info.compress_type = compression
+                return zf.open(info, "w", force_zip64=True)
+
+            # Segments are written straight into zip entries, never held whole in memory
+            seg = TsSegmenter(job.segment_seconds, open_segment)
+            try:
+                with self._ffmpeg(args) as proc:
+                    last_update, last_pct = time.time(), -1
+                    for chunk in iter(lambda: proc.stdout.read1(1 << 16), b""):
+                        seg.feed(chunk)
+                        pct = max(0, min(100, int(seg.position * 100 / duration)))
+                        # Emit only on a new percent, and not too often, to avoid UI thrash
+                        if pct > last_pct and time.time() - last_update > 0.1:
+                            self.sig.file_progress.emit(src.name, pct)
+                            last_update, last_pct = time.time(), pct
+                seg.finish()
+            finally:
+                seg.close()  # ZipFile refuses to close while an entry is open for writing
+            zf.writestr("playlist.m3u8", seg.playlist(), compress_type=compression)
+
+    def _convert_via_folder(self, ffmpeg: str, job: Job, codec_args: List[str], duration: float, zip_path: Path):
+        """Let ffmpeg's HLS muxer write segments to a folder, then zip it."""
+        src = job.src
+        out_dir = job.out_root / (job.stem + "_hls")
+        if out_dir.exists():
+            discard_dir(out_dir, ignore_errors=False)  # stale segments must not end up in the zip
+        out_dir.mkdir(parents=True, exist_ok=True)
+
         m3u8_path = out_dir / "playlist.m3u8"
         seg_tmpl = out_dir / "segment_%05d.ts"
 
         # Build ffmpeg args
         args = [
-            ffmpeg, "-y", "-hide_banner", "-loglevel", "error", "-stats",
-            "-i", str(src),
-        ]
-        if hls_ok:
-            args += ["-c:v", "copy", "-c:a", "copy"]
-        else:
-            # Transcode path (if user later enables)
-            args += ["-c:v", "libx264", "-preset", "veryfast", "-crf", "18", "-c:a", "aac", "-b:a", "192k"]
-
-        args += [
+            ffmpeg, "-y", "-hide_banner", "-loglevel", "error",
+            "-progress", "pipe:1", "-nostats",
+            "-fflags", "+genpts", "-i", str(src),
+            *codec_args,
             "-movflags", "+faststart",
             "-f", "hls",
             "-hls_time", str(job.segment_seconds),
@@ -213,54 +760,33 @@ class ConverterThread(QThread):
             str(m3u8_path),
         ]
 
-        # Run and live-parse progress from stderr ("time=")
-        with subprocess.Popen(args, stderr=subprocess.PIPE, stdout=subprocess.PIPE, text=True, bufsize=1) as proc:
-            last_update = time.time()
-            while True:
-                line = proc.stderr.readline()
-                if not line:
-                    if proc.poll() is not None:
-                        break
-                    time.sleep(0.05)
+        # Run and live-parse progress from stdout ("out_time_us=" key/value lines).
+        # Reads block until ffmpeg writes or exits; stop() unblocks them by terminating it.
+        # Lines are matched as bytes to skip decoding every progress line.
+        with self._ffmpeg(args) as proc:
+            last_update, last_pct = time.time(), -1
+            for line in proc.stdout:
+                if not line.startswith(b"out_time_us="):
                     continue
-                # Parse a rough progress if we find time= in status lines
-                if "time=" in line:
-                    tpos = None
-                    try:
-                        # Extract HH:MM:SS.xx after time=
-                        tstr = line.split("time=")[-1].split(" ")[0].strip()
-                        h, m, s = tstr.split(":")
-                        cur = float(h) * 3600 + float(m) * 60 + float(s)
-                        pct = max(0, min(100, int(cur * 100 / duration)))
-                        # Emit less frequently to avoid UI thrash
-                        if time.time() - last_update > 0.05:
-                            self.sig.file_progress.emit(src.name, pct)
-                            last_update = time.time()
-                    except Exception:
-                        pass
-
-            rc = proc.wait()
-            if rc != 0:
-                raise RuntimeError("ffmpeg failed — check logs and ensure codecs are supported.")
+                try:
+                    pct = max(0, min(100, int(int(line[12:]) / (duration * 10_000))))
+                except ValueError:
+                    continue  # "N/A" before the first packet is muxed
+                # Emit only on a new percent, and not too often, to avoid UI thrash
+                if pct > last_pct and time.time() - last_update > 0.1:
+                    self.sig.file_progress.emit(src.name, pct)
+                    last_update, last_pct = time.time(), pct
 
         # Zip the folder
-        zip_path = job.out_root / f"{src.stem}.zip"
-        if zip_path.exists():
-            zip_path.unlink()
-        with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=6) as zf:
-            for root, _, files in os.walk(out_dir):
-                for f in files:
-                    p = Path(root) / f
-                    # Simpan relatif dari out_dir agar isi zip bersih
-                    arcname = os.path.relpath(p, out_dir)
-                    zf.write(p, arcname=arcname)
+        # HLS output is flat (segments + playlist), so arcname is just the file name
+        with os.scandir(out_dir) as it:
+            entries = [(entry.path, entry.name, entry.stat().st_size) for entry in it if entry.is_file()]
+        with self._zip_file(job, zip_path, presize=sum(size for _, _, size in entries)) as (zf, compression):
+            for path, name, _ in entries:
+                zf.write(path, arcname=name, compress_type=compression)
 
         # Hapus folder HLS setelah di-zip
-        shutil.rmtree(out_dir, ignore_errors=True)
-
-        self.sig.log.emit(f"DONE: {src.name} → {zip_path.name}")
-        self.sig.file_progress.emit(src.name, 100)
-
+        discard_dir(out_dir)
 
 
 class SkipError(Exception):
@@ -279,13 +805,30 @@ def load_last_output() -> Optional[Path]:
     return None
 
 
-def save_last_output(path: Path):
+def load_parallel_jobs() -> int:
+    if CONFIG_FILE.exists():
+        try:
+            data = json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
+            return max(1, int(data["parallel_jobs"]))
+        except Exception:
+            pass
+    return default_parallel_jobs()
+
+
+def save_last_output(path: Path, parallel_jobs: Optional[int] = None):
     data = {"last_output": str(path)}
     try:
         data["segment_seconds"] = int(getattr(MainWindow.instance(), "segment_input").value())
     except Exception:
         pass
-    CONFIG_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    data["parallel_jobs"] = parallel_jobs if parallel_jobs is not None else load_parallel_jobs()
+    try:
+        paths = find_ffmpeg_binaries()
+        if not any(_is_bundled_path(c) for c in paths):
+            data["ffmpeg_paths"] = list(paths)
+    except FileNotFoundError:
+        pass
+    write_json_atomic(CONFIG_FILE, data)
 
 
 # ---------- UI ----------
@@ -297,6 +840,7 @@ class DropList(QListWidget):
         self.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.setAlternatingRowColors(True)
         self.setMinimumHeight(180)
+        self._paths = set()  # str paths currently listed, for O(1) duplicate checks
 
     def dragEnterEvent(self, e):
         if e.mimeData().hasUrls():
@@ -313,34 +857,45 @@ class DropList(QListWidget):
     def dropEvent(self, e):
         if not e.mimeData().hasUrls():
             return super().dropEvent(e)
+        found = []
         for url in e.mimeData().urls():
             p = Path(url.toLocalFile())
             if p.suffix.lower() == ".mp4" and p.exists():
+                found.append(p)
+        # Add in one batch so the view repaints once, not per file
+        self.setUpdatesEnabled(False)
+        try:
+            for p in sorted(set(found)):
                 self.add_path(p)
+        finally:
+            self.setUpdatesEnabled(True)
         e.acceptProposedAction()
 
     def add_path(self, p: Path):
         # Avoid duplicates
-        for i in range(self.count()):
-            if self.item(i).data(Qt.UserRole) == str(p):
-                return
+        if str(p) in self._paths:
+            return
+        self._paths.add(str(p))
         item = QListWidgetItem(p.name)
         item.setToolTip(str(p))
         item.setData(Qt.UserRole, str(p))
         self.addItem(item)
 
-    def paths(self) -> List[Path]:
-        out = []
+    def iter_paths(self) -> Iterator[Path]:
         for i in range(self.count()):
-            out.append(Path(self.item(i).data(Qt.UserRole)))
-        return out
+            yield Path(self.item(i).data(Qt.UserRole))
+
+    def paths(self) -> List[Path]:
+        return list(self.iter_paths())
 
     def remove_selected(self):
         for i in sorted([idx.row() for idx in self.selectedIndexes()], reverse=True):
-            self.takeItem(i)
+            item = self.takeItem(i)
+            self._paths.discard(item.data(Qt.UserRole))
 
     def clear_all(self):
         self.clear()
+        self._paths.clear()
 
 
 class MainWindow(QMainWindow):
@@ -359,14 +914,17 @@ class MainWindow(QMainWindow):
         self.btn_remove = QPushButton("Remove Selected")
         self.chk_zip = QCheckBox("Zip hasil (otomatis)")
         self.chk_zip.setChecked(True)
+        self.chk_zip_compress = QCheckBox("Kompres zip (lebih lambat, ukuran hampir sama)")
+        self.chk_zip_compress.setChecked(False)
         self.chk_skip = QCheckBox("Skip file yang codec-nya tidak HLS-friendly (no re-encode)")
         self.chk_skip.setChecked(True)
         self.chk_trans = QCheckBox("Jika tidak compatible, transcode otomatis (bisa kurangi kualitas)")
         self.chk_trans.setChecked(False)
         self.progress_all = QProgressBar()
         self.progress_all.setValue(0)
-        self.log = QTextEdit()
+        self.log = QPlainTextEdit()
         self.log.setReadOnly(True)
+        self.log.setMaximumBlockCount(2000)  # keep appends O(1) on long batches
 
         # Layout
         top = QWidget()
@@ -395,6 +953,7 @@ class MainWindow(QMainWindow):
         v.addWidget(self._hline())
 
         v.addWidget(self.chk_zip)
+        v.addWidget(self.chk_zip_compress)
         v.addWidget(self.chk_skip)
         v.addWidget(self.chk_trans)
 
@@ -408,6 +967,16 @@ class MainWindow(QMainWindow):
         row_seg.addWidget(self.segment_input)
         v.addLayout(row_seg)
 
+        row_par = QHBoxLayout()
+        self.parallel_label = QLabel("Parallel jobs:")
+        self.parallel_input = QSpinBox()
+        self.parallel_input.setMinimum(1)
+        self.parallel_input.setMaximum(max(1, os.cpu_count() or 1))
+        self.parallel_input.setValue(min(load_parallel_jobs(), self.parallel_input.maximum()))
+        row_par.addWidget(self.parallel_label)
+        row_par.addWidget(self.parallel_input)
+        v.addLayout(row_par)
+
         ctrls = QHBoxLayout()
         ctrls.addWidget(self.progress_all)
         ctrls.addWidget(self.btn_convert)
@@ -424,7 +993,15 @@ class MainWindow(QMainWindow):
         self.btn_convert.clicked.connect(self.start_convert)
 
         self.out_dir: Optional[Path] = None
-        self.worker: Optional[ConverterThread] = None
+        self.worker: Optional[ConverterBatch] = None
+        self.pool = QThreadPool(self)
+
+        # Settings are written debounced, on a background thread, to keep disk latency off the UI
+        self._config_dirty = False
+        self._config_timer = QTimer(self)
+        self._config_timer.setSingleShot(True)
+        self._config_timer.timeout.connect(self._flush_config)
+        self._config_writer = ThreadPoolExecutor(max_workers=1)
 
         # Menu: Help → FFmpeg status
         menubar = self.menuBar()
@@ -437,6 +1014,10 @@ class MainWindow(QMainWindow):
         self.drop.model().rowsInserted.connect(self.update_convert_enabled)
         self.drop.model().rowsRemoved.connect(self.update_convert_enabled)
 
+        # Warm the binary lookup cache if ffmpeg was found on a previous run
+        if load_ffmpeg_paths():
+            find_ffmpeg_binaries()
+
         last = load_last_output()
         if last:
             self.out_dir = last
@@ -450,6 +1031,7 @@ class MainWindow(QMainWindow):
         return line
 
     def check_ffmpeg(self):
+        find_ffmpeg_binaries.cache_clear()  # report what is on disk now, not a cached lookup
         try:
             ffmpeg, ffprobe = find_ffmpeg_binaries()
             self._log(f"FFmpeg: {ffmpeg}\nFFprobe: {ffprobe}")
@@ -462,14 +1044,37 @@ class MainWindow(QMainWindow):
         if path:
             self.out_dir = Path(path)
             self.out_label.setText(f"Output folder: {self.out_dir}")
-            save_last_output(self.out_dir)
+            self._save_config()
             self.update_convert_enabled()
 
+    def _save_config(self):
+        self._config_dirty = True
+        self._config_timer.start(500)
+
+    def _flush_config(self):
+        if not self._config_dirty or self.out_dir is None:
+            return
+        self._config_dirty = False
+        self._config_writer.submit(save_last_output, self.out_dir, int(self.parallel_input.value()))
+
+    def closeEvent(self, e):
+        # Drop queued jobs and kill running ffmpegs, or ~QThreadPool would block until the batch ends
+        if self.worker is not None:
+            self.pool.clear()
+            self.worker.stop()
+        self._config_timer.stop()
+        self._flush_config()
+        self._config_writer.shutdown(wait=True)
+        super().closeEvent(e)
+
     def update_convert_enabled(self):
-        ok = self.drop.count() > 0 and self.out_dir is not None
+        # Only one batch at a time: closeEvent can then stop everything running on the pool
+        ok = self.drop.count() > 0 and self.out_dir is not None and self.worker is None
         self.btn_convert.setEnabled(ok)
 
     def start_convert(self):
+        if self.worker is not None:
+            return  # previous batch still running
         if not self.out_dir:
             QMessageBox.information(self, APP_TITLE, "Pilih folder output dulu.")
             return
@@ -478,20 +1083,24 @@ class MainWindow(QMainWindow):
             return
 
         seg_seconds = int(self.segment_input.value())
+        parallel = int(self.parallel_input.value())
+        self._save_config()
         jobs = [
             Job(
-                src=Path(item.data(Qt.UserRole)),
+                src=p,
+                out_stem=stem,
                 out_root=self.out_dir,
                 skip_if_incompatible=self.chk_skip.isChecked(),
                 enable_transcode_if_needed=self.chk_trans.isChecked(),
                 segment_seconds=seg_seconds,
+                zip_compress=self.chk_zip_compress.isChecked(),
             )
-            for item in [self.drop.item(i) for i in range(self.drop.count())]
+            for p, stem in unique_output_stems(self.drop.iter_paths())
         ]
 
         self.progress_all.setValue(0)
         self.log.clear()
-        self.worker = ConverterThread(jobs)
+        self.worker = ConverterBatch(jobs, parallel)
         s = self.worker.sig
         s.log.connect(self._log)
         s.progress.connect(self.progress_all.setValue)
@@ -499,7 +1108,7 @@ class MainWindow(QMainWindow):
         s.file_done.connect(self._on_file_done)
         s.all_done.connect(self._on_all_done)
         self.btn_convert.setEnabled(False)
-        self.worker.start()
+        self.worker.start(self.pool)
 
     def _on_file_progress(self, name: str, pct: int):
         self.statusBar().showMessage(f"{name}: {pct}%")
@@ -509,12 +1118,12 @@ class MainWindow(QMainWindow):
 
     def _on_all_done(self):
         self._log("Semua pekerjaan selesai.")
-        self.btn_convert.setEnabled(True)
+        self.worker = None
+        self.update_convert_enabled()
         self.statusBar().clearMessage()
 
     def _log(self, msg: str):
-        self.log.append(msg)
-        self.log.ensureCursorVisible()
+        self.log.appendPlainText(msg)
 
 
 def main():